@@ -66,10 +66,12 @@ _HOUR2RAD  =  0.2617993877991494365     # pi/12 = factor to convert sidereal hou
 _DAYS_PER_TROPICAL_YEAR = 365.24217
 _PI2 = 2.0 * math.pi
 _EPOCH = datetime.datetime(2000, 1, 1, 12)
+_EPOCH_UNIX_SECONDS = 946728000.0   # seconds from 1970-01-01T00:00Z to 2000-01-01T12:00Z
 _ASEC360 = 1296000.0
 _ASEC2RAD = 4.848136811095359935899141e-6
 _ARC = 3600.0 * 180.0 / math.pi     # arcseconds per radian
 _ANGVEL = 7.2921150e-5
+_ANGVEL_PER_DAY = _ANGVEL * 86400.0
 _SECONDS_PER_DAY = 24.0 * 3600.0
 _SOLAR_DAYS_PER_SIDEREAL_DAY = 0.9972695717592592
 _MEAN_SYNODIC_MONTH = 29.530588
@@ -85,6 +87,7 @@ _EARTH_FLATTENING_SQUARED = _EARTH_FLATTENING ** 2
 _EARTH_EQUATORIAL_RADIUS_KM = 6378.1366
 _EARTH_POLAR_RADIUS_KM = _EARTH_EQUATORIAL_RADIUS_KM * _EARTH_FLATTENING
 _EARTH_EQUATORIAL_RADIUS_AU = _EARTH_EQUATORIAL_RADIUS_KM / KM_PER_AU
+_METERS_PER_AU = 1000.0 * KM_PER_AU
 _EARTH_MEAN_RADIUS_KM = 6371.0      # mean radius of the Earth's geoid, without atmosphere
 _EARTH_ATMOSPHERE_KM = 88.0         # effective atmosphere thickness for lunar eclipses
 _EARTH_ECLIPSE_RADIUS_KM = _EARTH_MEAN_RADIUS_KM + _EARTH_ATMOSPHERE_KM
@@ -168,18 +171,24 @@ class _PrecessDir(enum.Enum):
     Into2000 = 1
 
 def _LongitudeOffset(diff: float) -> float:
-    offset: float = diff
-    while offset <= -180.0:
+    # Returns the equivalent angle in the range (-180, +180].
+    # math.fmod is exact and keeps the result in (-360, +360),
+    # so at most one correction is needed, no matter how large `diff` is.
+    offset: float = math.fmod(diff, 360.0)
+    if offset <= -180.0:
         offset += 360.0
-    while offset > 180.0:
+    elif offset > 180.0:
         offset -= 360.0
     return offset
 
 def _NormalizeLongitude(lon: float) -> float:
-    while lon < 0.0:
+    # Returns the equivalent angle in the range [0, 360).
+    lon = math.fmod(lon, 360.0)
+    if lon < 0.0:
         lon += 360.0
-    while lon >= 360.0:
-        lon -= 360.0
+        if lon >= 360.0:
+            # A tiny negative angle can round up to exactly 360.
+            lon -= 360.0
     return lon
 
 class Vector:
@@ -213,7 +222,8 @@ class Vector:
         """Returns the length of the vector in AU."""
         # It would be nice to use math.hypot() here,
         # but before Python 3.8, it only accepts 2 arguments.
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x*x + y*y + z*z)
 
     def __add__(self, other: "Vector") -> "Vector":
         return Vector(self.x + other.x, self.y + other.y, self.z + other.z, self.t)
@@ -434,12 +444,12 @@ def BodyCode(name):
     <Body.Mars: 3>
 
     """
-    if name not in Body.__members__:
-        return Body.Invalid
-    return Body[name]
+    return Body.__members__.get(name, Body.Invalid)
+
+_SuperiorPlanets = frozenset([Body.Mars, Body.Jupiter, Body.Saturn, Body.Uranus, Body.Neptune, Body.Pluto])
 
 def _IsSuperiorPlanet(body):
-    return body in [Body.Mars, Body.Jupiter, Body.Saturn, Body.Uranus, Body.Neptune, Body.Pluto]
+    return body in _SuperiorPlanets
 
 _PlanetOrbitalPeriod = [
     87.969,
@@ -550,14 +560,18 @@ def AngleBetween(a, b):
         The angle between the two vectors expressed in degrees.
         The value is in the range [0, 180].
     """
-    r = a.Length() * b.Length()
-    if r < 1.0e-8:
-        return BadVectorError()
-    dot = (a.x*b.x + a.y*b.y + a.z*b.z) / r
-    if dot <= -1.0:
-        return 180.0
-    if dot >= +1.0:
-        return 0.0
+    ax, ay, az = a.x, a.y, a.z
+    bx, by, bz = b.x, b.y, b.z
+    # Multiply the squared lengths so that only one square root is needed.
+    r2 = (ax*ax + ay*ay + az*az) * (bx*bx + by*by + bz*bz)
+    if r2 < 1.0e-16:
+        raise BadVectorError()
+    dot = (ax*bx + ay*by + az*bz) / math.sqrt(r2)
+    # Roundoff can push the cosine slightly outside the domain of acos.
+    if dot > 1.0:
+        dot = 1.0
+    elif dot < -1.0:
+        dot = -1.0
     return math.degrees(math.acos(dot))
 
 
@@ -590,6 +604,12 @@ def DeltaT_EspenakMeeus(ut):
 
     y = 2000 + ((ut - 14) / _DAYS_PER_TROPICAL_YEAR)
 
+    # Check the present era first, because it is by far the most common input.
+    # This avoids walking through all the historical intervals below.
+    if 2005 <= y < 2050:
+        u = y - 2000
+        return 62.92 + 0.32217*u + 0.005589*u*u
+
     if y < -500:
         u = (y - 1820) / 100
         return -20 + (32 * u*u)
@@ -649,10 +669,6 @@ def DeltaT_EspenakMeeus(ut):
         u2 = u*u; u3 = u*u2; u4 = u2*u2; u5 = u2*u3
         return 63.86 + 0.3345*u - 0.060374*u2 + 0.0017275*u3 + 0.000651814*u4 + 0.00002373599*u5
 
-    if y < 2050:
-        u = y - 2000
-        return 62.92 + 0.32217*u + 0.005589*u*u
-
     if y < 2150:
         u = (y-1820)/100
         return -20 + 32*u*u - 0.5628*(2150 - y)
@@ -728,6 +744,8 @@ class Time:
         such as the orbits of planets around the Sun, or the Moon around the Earth.
         Historically, Terrestrial Time has also been known by the term *Ephemeris Time* (ET).
     """
+    __slots__ = ('ut', 'tt', '_et', '_st', '_nut', '_prec')
+
     def __init__(self, ut, tt = None):
         if isinstance(ut, str):
             # Undocumented hack, to make repr(time) reversible.
@@ -742,6 +760,8 @@ class Time:
                 self.tt = tt
         self._et = None     # lazy-cache for earth tilt
         self._st = None     # lazy-cache for sidereal time
+        self._nut = None    # lazy-cache for nutation matrix
+        self._prec = None   # lazy-cache for precession matrix
 
     @staticmethod
     def FromTerrestrialTime(tt):
@@ -852,7 +872,8 @@ class Time:
         -------
         Time
         """
-        ut = (datetime.datetime.utcnow() - _EPOCH).total_seconds() / 86400.0
+        unix_seconds = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        ut = (unix_seconds - _EPOCH_UNIX_SECONDS) / 86400.0
         return Time(ut)
 
     def AddDays(self, days):
@@ -974,6 +995,8 @@ class Observer:
     height : float
         Elevation above sea level in meters.
     """
+    __slots__ = ('latitude', 'longitude', 'height')
+
     def __init__(self, latitude, longitude, height=0.0):
         self.latitude = latitude
         self.longitude = longitude
@@ -1027,55 +1050,57 @@ class Spherical:
     def __repr__(self):
         return 'Spherical(lat={}, lon={}, dist={})'.format(self.lat, self.lon, self.dist)
 
+def _iau2000b_core(tt):
+    # Truncated 5-term IAU2000B nutation series; returns (dpsi, deps) in arcseconds.
+    t = tt / 36525.0
+    elp = math.fmod((1287104.79305 + t*129596581.0481),  _ASEC360) * _ASEC2RAD
+    f   = math.fmod((335779.526232 + t*1739527262.8478), _ASEC360) * _ASEC2RAD
+    d   = math.fmod((1072260.70369 + t*1602961601.2090), _ASEC360) * _ASEC2RAD
+    om  = math.fmod((450160.398036 - t*6962890.5431),    _ASEC360) * _ASEC2RAD
+
+    som = math.sin(om)
+    com = math.cos(om)
+    dp = (-172064161.0 - 174666.0*t)*som + 33386.0*com
+    de = (92052331.0 + 9086.0*t)*com + 15377.0*som
+
+    arg = 2.0*(f - d + om)
+    sarg = math.sin(arg)
+    carg = math.cos(arg)
+    dp += (-13170906.0 - 1675.0*t)*sarg - 13696.0*carg
+    de += (5730336.0 - 3015.0*t)*carg - 4587.0*sarg
+
+    arg = 2.0*(f + om)
+    sarg = math.sin(arg)
+    carg = math.cos(arg)
+    dp += (-2276413.0 - 234.0*t)*sarg + 2796.0*carg
+    de += (978459.0 - 485.0*t)*carg + 1374.0*sarg
+
+    # Use double-angle identities for 2*om instead of two more trig calls.
+    sarg = 2.0*som*com
+    carg = com*com - som*som
+    dp += (2074554.0 + 207.0*t)*sarg - 698.0*carg
+    de += (-897492.0 + 470.0*t)*carg - 291.0*sarg
+
+    sarg = math.sin(elp)
+    carg = math.cos(elp)
+    dp += (1475877.0 - 3633.0*t)*sarg + 11817.0*carg
+    de += (73871.0 - 184.0*t)*carg - 1924.0*sarg
+
+    return (-0.000135 + (dp * 1.0e-7)), (+0.000388 + (de * 1.0e-7))
+
 class _iau2000b:
     def __init__(self, time):
-        t = time.tt / 36525.0
-        elp = math.fmod((1287104.79305 + t*129596581.0481),  _ASEC360) * _ASEC2RAD
-        f   = math.fmod((335779.526232 + t*1739527262.8478), _ASEC360) * _ASEC2RAD
-        d   = math.fmod((1072260.70369 + t*1602961601.2090), _ASEC360) * _ASEC2RAD
-        om  = math.fmod((450160.398036 - t*6962890.5431),    _ASEC360) * _ASEC2RAD
-
-        sarg = math.sin(om)
-        carg = math.cos(om)
-        dp = (-172064161.0 - 174666.0*t)*sarg + 33386.0*carg
-        de = (92052331.0 + 9086.0*t)*carg + 15377.0*sarg
-
-        arg = 2.0*(f - d + om)
-        sarg = math.sin(arg)
-        carg = math.cos(arg)
-        dp += (-13170906.0 - 1675.0*t)*sarg - 13696.0*carg
-        de += (5730336.0 - 3015.0*t)*carg - 4587.0*sarg
-
-        arg = 2.0*(f + om)
-        sarg = math.sin(arg)
-        carg = math.cos(arg)
-        dp += (-2276413.0 - 234.0*t)*sarg + 2796.0*carg
-        de += (978459.0 - 485.0*t)*carg + 1374.0*sarg
-
-        arg = 2.0*om
-        sarg = math.sin(arg)
-        carg = math.cos(arg)
-        dp += (2074554.0 + 207.0*t)*sarg - 698.0*carg
-        de += (-897492.0 + 470.0*t)*carg - 291.0*sarg
-
-        sarg = math.sin(elp)
-        carg = math.cos(elp)
-        dp += (1475877.0 - 3633.0*t)*sarg + 11817.0*carg
-        de += (73871.0 - 184.0*t)*carg - 1924.0*sarg
-
-        self.dpsi = -0.000135 + (dp * 1.0e-7)
-        self.deps = +0.000388 + (de * 1.0e-7)
+        self.dpsi, self.deps = _iau2000b_core(time.tt)
+
+# Mean obliquity polynomial coefficients, converted from arcseconds to degrees.
+_MOBL_COEFS = tuple(c / 3600.0 for c in (
+    84381.406, -46.836769, -0.0001831, 0.00200340, -0.000000576, -0.0000000434
+))
 
 def _mean_obliq(tt):
     t = tt / 36525
-    asec = (
-        (((( -  0.0000000434   * t
-             -  0.000000576  ) * t
-             +  0.00200340   ) * t
-             -  0.0001831    ) * t
-             - 46.836769     ) * t + 84381.406
-    )
-    return asec / 3600.0
+    c0, c1, c2, c3, c4, c5 = _MOBL_COEFS
+    return c0 + t*(c1 + t*(c2 + t*(c3 + t*(c4 + t*c5))))
 
 class _e_tilt:
     def __init__(self, time):
@@ -1100,35 +1125,36 @@ def _obl_ecl2equ_vec(obl_deg, ecl):
 def _ecl2equ_vec(time, ecl):
     return _obl_ecl2equ_vec(_mean_obliq(time.tt), ecl)
 
-def _precession_rot(time, direction):
-    eps0 = 84381.406
-    t = time.tt / 36525
+# Precession angle polynomial coefficients, converted from arcseconds to radians.
+_PREC_EPS0 = 84381.406 * _ASEC2RAD
+_PREC_SIN_EPS0 = math.sin(_PREC_EPS0)
+_PREC_COS_EPS0 = math.cos(_PREC_EPS0)
+_PREC_PSIA_COEFS = tuple(c * _ASEC2RAD for c in (
+    5038.481507, -1.0790069, -0.00114045, 0.000132851, -0.0000000951
+))
+_PREC_OMEGAA_COEFS = (_PREC_EPS0,) + tuple(c * _ASEC2RAD for c in (
+    -0.025754, 0.0512623, -0.00772503, -0.000000467, 0.0000003337
+))
+_PREC_CHIA_COEFS = tuple(c * _ASEC2RAD for c in (
+    10.556403, -2.3814292, -0.00121197, 0.000170663, -0.0000000560
+))
+
+def _precession_matrix(time):
+    # Returns the 9 precession matrix elements (xx, yx, zx, xy, yy, zy, xz, yz, zz),
+    # cached inside the Time object so that repeated rotations at the same time are cheap.
+    if time._prec is not None:
+        return time._prec
 
-    psia  = (((((-    0.0000000951  * t
-                 +    0.000132851 ) * t
-                 -    0.00114045  ) * t
-                 -    1.0790069   ) * t
-                 + 5038.481507    ) * t)
-
-    omegaa = (((((+   0.0000003337  * t
-                 -    0.000000467 ) * t
-                 -    0.00772503  ) * t
-                 +    0.0512623   ) * t
-                 -    0.025754    ) * t + eps0)
-
-    chia  = (((((-    0.0000000560  * t
-                 +    0.000170663 ) * t
-                 -    0.00121197  ) * t
-                 -    2.3814292   ) * t
-                 +   10.556403    ) * t)
-
-    eps0 *= _ASEC2RAD
-    psia *= _ASEC2RAD
-    omegaa *= _ASEC2RAD
-    chia *= _ASEC2RAD
-
-    sa = math.sin(eps0)
-    ca = math.cos(eps0)
+    t = time.tt / 36525
+    p1, p2, p3, p4, p5 = _PREC_PSIA_COEFS
+    psia = t*(p1 + t*(p2 + t*(p3 + t*(p4 + t*p5))))
+    w0, w1, w2, w3, w4, w5 = _PREC_OMEGAA_COEFS
+    omegaa = w0 + t*(w1 + t*(w2 + t*(w3 + t*(w4 + t*w5))))
+    c1, c2, c3, c4, c5 = _PREC_CHIA_COEFS
+    chia = t*(c1 + t*(c2 + t*(c3 + t*(c4 + t*c5))))
+
+    sa = _PREC_SIN_EPS0
+    ca = _PREC_COS_EPS0
     sb = math.sin(-psia)
     cb = math.cos(-psia)
     sc = math.sin(-omegaa)
@@ -1145,6 +1171,11 @@ def _precession_rot(time, direction):
     xz =  sb * sc
     yz = -sc * cb * ca - sa * cc
     zz = -sc * cb * sa + cc * ca
+    time._prec = (xx, yx, zx, xy, yy, zy, xz, yz, zz)
+    return time._prec
+
+def _precession_rot(time, direction):
+    (xx, yx, zx, xy, yy, zy, xz, yz, zz) = _precession_matrix(time)
     if direction == _PrecessDir.Into2000:
         # Perform rotation from other epoch to J2000.0.
         return RotationMatrix([
@@ -1163,20 +1194,35 @@ def _precession_rot(time, direction):
 
     raise Error('Inalid precession direction')
 
-def _rotate(rot, vec):
-    return [
-        rot.rot[0][0]*vec[0] + rot.rot[1][0]*vec[1] + rot.rot[2][0]*vec[2],
-        rot.rot[0][1]*vec[0] + rot.rot[1][1]*vec[1] + rot.rot[2][1]*vec[2],
-        rot.rot[0][2]*vec[0] + rot.rot[1][2]*vec[1] + rot.rot[2][2]*vec[2]
-    ]
+def _rotate_elements(m, pos, direction):
+    # Rotates `pos` using the 9 elements of a precession or nutation matrix,
+    # without building an intermediate RotationMatrix.
+    (xx, yx, zx, xy, yy, zy, xz, yz, zz) = m
+    if direction == _PrecessDir.Into2000:
+        return [
+            xx*pos[0] + xy*pos[1] + xz*pos[2],
+            yx*pos[0] + yy*pos[1] + yz*pos[2],
+            zx*pos[0] + zy*pos[1] + zz*pos[2]
+        ]
+    if direction == _PrecessDir.From2000:
+        return [
+            xx*pos[0] + yx*pos[1] + zx*pos[2],
+            xy*pos[0] + yy*pos[1] + zy*pos[2],
+            xz*pos[0] + yz*pos[1] + zz*pos[2]
+        ]
+    raise Error('Invalid rotation direction')
+
+def _rotate_state_elements(m, state, direction):
+    # Same as _rotate_elements, but for both the position and velocity of a state vector.
+    pos = _rotate_elements(m, [state.x, state.y, state.z], direction)
+    vel = _rotate_elements(m, [state.vx, state.vy, state.vz], direction)
+    return StateVector(pos[0], pos[1], pos[2], vel[0], vel[1], vel[2], state.t)
 
 def _precession(pos, time, direction):
-    r = _precession_rot(time, direction)
-    return _rotate(r, pos)
+    return _rotate_elements(_precession_matrix(time), pos, direction)
 
 def _precession_posvel(state, time, direction):
-    r = _precession_rot(time, direction)
-    return RotateState(r, state)
+    return _rotate_state_elements(_precession_matrix(time), state, direction)
 
 class Equatorial:
     """Equatorial angular coordinates
@@ -1200,6 +1246,8 @@ class Equatorial:
         y = direction of the June solstice,
         z = north.
     """
+    __slots__ = ('ra', 'dec', 'dist', 'vec')
+
     def __init__(self, ra, dec, dist, vec):
         self.ra = ra
         self.dec = dec
@@ -1211,27 +1259,34 @@ class Equatorial:
 
 
 def _vector2radec(pos, time):
-    xyproj = pos[0]*pos[0] + pos[1]*pos[1]
-    dist = math.sqrt(xyproj + pos[2]*pos[2])
+    x, y, z = pos[0], pos[1], pos[2]
+    # Find the projection onto the xy-plane once, and reuse it for the distance.
+    xyproj = math.hypot(x, y)
+    dist = math.hypot(xyproj, z)
     if xyproj == 0.0:
-        if pos[2] == 0.0:
+        if z == 0.0:
             # Indeterminate coordinates: pos vector has zero length.
             raise BadVectorError()
         ra = 0.0
-        if pos[2] < 0.0:
+        if z < 0.0:
             dec = -90.0
         else:
             dec = +90.0
     else:
-        ra = _RAD2HOUR * math.atan2(pos[1], pos[0])
+        ra = _RAD2HOUR * math.atan2(y, x)
         if ra < 0:
             ra += 24
-        dec = math.degrees(math.atan2(pos[2], math.sqrt(xyproj)))
-    vec = Vector(pos[0], pos[1], pos[2], time)
+        dec = math.degrees(math.atan2(z, xyproj))
+    vec = Vector(x, y, z, time)
     return Equatorial(ra, dec, dist, vec)
 
 
-def _nutation_rot(time, direction):
+def _nutation_matrix(time):
+    # Returns the 9 nutation matrix elements (xx, yx, zx, xy, yy, zy, xz, yz, zz),
+    # cached inside the Time object so that repeated rotations at the same time are cheap.
+    if time._nut is not None:
+        return time._nut
+
     tilt = time._etilt()
     oblm = math.radians(tilt.mobl)
     oblt = math.radians(tilt.tobl)
@@ -1252,7 +1307,11 @@ def _nutation_rot(time, direction):
     xz = spsi * sobt
     yz = cpsi * cobm * sobt - sobm * cobt
     zz = cpsi * sobm * sobt + cobm * cobt
+    time._nut = (xx, yx, zx, xy, yy, zy, xz, yz, zz)
+    return time._nut
 
+def _nutation_rot(time, direction):
+    (xx, yx, zx, xy, yy, zy, xz, yz, zz) = _nutation_matrix(time)
     if direction == _PrecessDir.From2000:
         # convert J2000 to of-date
         return RotationMatrix([
@@ -1272,20 +1331,22 @@ def _nutation_rot(time, direction):
     raise Error('Invalid nutation direction')
 
 def _nutation(pos, time, direction):
-    r = _nutation_rot(time, direction)
-    return _rotate(r, pos)
+    return _rotate_elements(_nutation_matrix(time), pos, direction)
 
 def _nutation_posvel(state, time, direction):
-    r = _nutation_rot(time, direction)
-    return RotateState(r, state)
+    return _rotate_state_elements(_nutation_matrix(time), state, direction)
 
 def _era(time):        # Earth Rotation Angle
-    thet1 = 0.7790572732640 + 0.00273781191135448 * time.ut
-    thet3 = math.fmod(time.ut, 1.0)
-    theta = 360.0 * math.fmod((thet1 + thet3), 1.0)
-    if theta < 0.0:
-        theta += 360.0
-    return theta
+    ut = time.ut
+    # Taking fractions with floor() keeps both of them in [0, 1),
+    # so the result needs no correction for negative times.
+    f = 0.7790572732640 + 0.00273781191135448*ut + (ut - math.floor(ut))
+    return 360.0 * (f - math.floor(f))
+
+# Sidereal time polynomial coefficients, converted from arcseconds to degrees.
+_ST_COEFS = tuple(c / 3600.0 for c in (
+    0.014506, 4612.156534, 1.3915817, -0.00000044, -0.000029956, -0.0000000368
+))
 
 def SiderealTime(time):
     """Calculates Greenwich Apparent Sidereal Time (GAST).
@@ -1321,13 +1382,9 @@ def SiderealTime(time):
         t = time.tt / 36525.0
         eqeq = 15.0 * time._etilt().ee    # Replace with eqeq=0 to get GMST instead of GAST (if we ever need it)
         theta = _era(time)
-        st = (eqeq + 0.014506 +
-            (((( -    0.0000000368   * t
-                -    0.000029956  ) * t
-                -    0.00000044   ) * t
-                +    1.3915817    ) * t
-                + 4612.156534     ) * t)
-        gst = math.fmod((st/3600.0 + theta), 360.0) / 15.0
+        c0, c1, c2, c3, c4, c5 = _ST_COEFS
+        st = eqeq/3600.0 + (c0 + t*(c1 + t*(c2 + t*(c3 + t*(c4 + t*c5)))))
+        gst = math.fmod((st + theta), 360.0) / 15.0
         if gst < 0.0:
             gst += 24.0
         time._st = gst
@@ -1355,10 +1412,7 @@ def _inverse_terra(ovec, st):
         # Calculate exact longitude.
         lon_deg = math.degrees(stlocl) - (15.0 * st)
         # Normalize longitude to the range (-180, +180].
-        while lon_deg <= -180.0:
-            lon_deg += 360.0
-        while lon_deg > +180.0:
-            lon_deg -= 360.0
+        lon_deg = _LongitudeOffset(lon_deg)
         # Numerically solve for exact latitude, using Newton's Method.
         # Start with initial latitude estimate, based on a spherical Earth.
         lat = math.atan2(z, p)
@@ -1395,36 +1449,56 @@ def _inverse_terra(ovec, st):
             height_km = p/cos - adjust
     return Observer(lat_deg, lon_deg, 1000*height_km)
 
-def _terra_posvel(observer, st):
+def _terra_core(observer, st):
+    # Geodetic terms shared by _terra and _terra_posvel.
     phi = math.radians(observer.latitude)
     sinphi = math.sin(phi)
     cosphi = math.cos(phi)
     c = 1.0 / math.hypot(cosphi, sinphi*_EARTH_FLATTENING)
     s = _EARTH_FLATTENING_SQUARED * c
-    ht_km = observer.height / 1000.0
-    ach = _EARTH_EQUATORIAL_RADIUS_KM*c + ht_km
-    ash = _EARTH_EQUATORIAL_RADIUS_KM*s + ht_km
+    ht_au = observer.height / _METERS_PER_AU
+    achc = (_EARTH_EQUATORIAL_RADIUS_AU*c + ht_au) * cosphi
+    ash = _EARTH_EQUATORIAL_RADIUS_AU*s + ht_au
     stlocl = math.radians(15.0*st + observer.longitude)
+    return (achc, ash, sinphi, stlocl)
+
+def _terra_posvel(observer, st):
+    (achc, ash, sinphi, stlocl) = _terra_core(observer, st)
     sinst = math.sin(stlocl)
     cosst = math.cos(stlocl)
     return [
-        ach * cosphi * cosst / KM_PER_AU,
-        ach * cosphi * sinst / KM_PER_AU,
-        ash * sinphi / KM_PER_AU,
-        -_ANGVEL * ach * cosphi * sinst * 86400 / KM_PER_AU,
-        +_ANGVEL * ach * cosphi * cosst * 86400 / KM_PER_AU,
+        achc * cosst,
+        achc * sinst,
+        ash * sinphi,
+        -_ANGVEL_PER_DAY * achc * sinst,
+        +_ANGVEL_PER_DAY * achc * cosst,
         0.0
     ]
 
 def _terra(observer, st):
-    return _terra_posvel(observer, st)[0:3]
+    (achc, ash, sinphi, stlocl) = _terra_core(observer, st)
+    return [
+        achc * math.cos(stlocl),
+        achc * math.sin(stlocl),
+        ash * sinphi
+    ]
 
 def _geo_pos(time, observer):
+    # This is _precession(_nutation(_terra(...), Into2000), Into2000)
+    # with both rotations applied to local variables, avoiding the
+    # intermediate lists and direction checks of the generic functions.
     gast = SiderealTime(time)
-    pos1 = _terra(observer, gast)
-    pos2 = _nutation(pos1, time, _PrecessDir.Into2000)
-    outpos = _precession(pos2, time, _PrecessDir.Into2000)
-    return outpos
+    (x, y, z) = _terra(observer, gast)
+    (xx, yx, zx, xy, yy, zy, xz, yz, zz) = _nutation_matrix(time)
+    nx = xx*x + xy*y + xz*z
+    ny = yx*x + yy*y + yz*z
+    nz = zx*x + zy*y + zz*z
+    (xx, yx, zx, xy, yy, zy, xz, yz, zz) = _precession_matrix(time)
+    return [
+        xx*nx + xy*ny + xz*nz,
+        yx*nx + yy*ny + yz*nz,
+        zx*nx + zy*ny + zz*nz
+    ]
 
 def _spin(angle, pos1):
     angr = math.radians(angle)
@@ -1634,7 +1708,7 @@ def EclipticGeoMoon(time):
 
     # Obtain true and mean obliquity angles for the given time.
     # This serves to pre-calculate the nutation also, and cache it in `time`.
-    et = _e_tilt(time)
+    et = time._etilt()
 
     # Convert ecliptic coordinates to equatorial coordinates, both in mean equinox of date.
     eqm = _obl_ecl2equ_vec(et.mobl, ecm)
@@ -1911,7 +1985,8 @@ class _TerseVector:
 
     def quadrature(self):
         '''Return magnitude squared of this vector.'''
-        return self.x**2 + self.y**2 + self.z**2
+        x, y, z = self.x, self.y, self.z
+        return x*x + y*y + z*z
 
     def mean(self, other):
         '''Return the average of this vector and another vector.'''
@@ -3599,7 +3674,7 @@ def Ecliptic(eqj):
     # Calculate nutation and obliquity for this time.
     # As an optimization, the nutation angles are cached in `eqj.t`,
     # and reused below when the `nutation` function is called.
-    et = _e_tilt(eqj.t)
+    et = eqj.t._etilt()
 
     # Convert J2000 mean equator (EQJ) to true equator of date (EQD).
     mean_pos = _precession([eqj.x, eqj.y, eqj.z], eqj.t, _PrecessDir.From2000)
@@ -6199,7 +6274,7 @@ def Rotation_ECT_EQD(time):
     RotationMatrix
         A rotation matrix that converts ECT to EQD.
     """
-    et = _e_tilt(time)
+    et = time._etilt()
     tobl = math.radians(et.tobl)
     c = math.cos(tobl)
     s = math.sin(tobl)
@@ -6227,7 +6302,7 @@ def Rotation_EQD_ECT(time):
     RotationMatrix
         A rotation matrix that converts EQD to ECT.
     """
-    et = _e_tilt(time)
+    et = time._etilt()
     tobl = math.radians(et.tobl)
     c = math.cos(tobl)
     s = math.sin(tobl)
@@ -2170,6 +2170,28 @@ def Issue103():
 
 #-----------------------------------------------------------------------------------------------------------
 
+def AngleBetweenTest():
+    time = astronomy.Time.Make(2023, 1, 1, 0, 0, 0)
+    a = astronomy.Vector(1.0, 2.0, 3.0, time)
+    angle = astronomy.AngleBetween(a, a)
+    if angle != 0.0:
+        return Fail('AngleBetweenTest', 'angle between identical vectors = {}'.format(angle))
+    angle = astronomy.AngleBetween(a, -a)
+    if angle != 180.0:
+        return Fail('AngleBetweenTest', 'angle between opposite vectors = {}'.format(angle))
+    angle = astronomy.AngleBetween(a, astronomy.Vector(-2.0, 1.0, 0.0, time))
+    if vabs(angle - 90.0) > 1.0e-12:
+        return Fail('AngleBetweenTest', 'angle between perpendicular vectors = {}'.format(angle))
+    try:
+        astronomy.AngleBetween(a, astronomy.Vector(0.0, 0.0, 0.0, time))
+    except astronomy.BadVectorError:
+        pass
+    else:
+        return Fail('AngleBetweenTest', 'zero-length vector should have raised BadVectorError')
+    return Pass('AngleBetweenTest')
+
+#-----------------------------------------------------------------------------------------------------------
+
 class _bary_stats_t:
     def __init__(self):
         self.max_rdiff = 0.0
@@ -3176,6 +3198,7 @@ def HourAngle():
 
 UnitTests = {
     'aberration':               Aberration,
+    'angle_between':            AngleBetweenTest,
     'axis':                     Axis,
     'barystate':                BaryState,
     'constellation':            Constellation,